@@ -4,26 +4,28 @@ from typing import Final
 UTF_16_LE_BOM: Final = b"\xFF\xFE"
 UTF_8_BOM: Final = b"\xEF\xBB\xBF"
 
+_BOM_OFFSETS: Final = {UTF_8_BOM: 3, UTF_16_LE_BOM: 2}
+
 
 def _offset_by_bom(data: bytes) -> int:
-    return 2 if data.startswith(UTF_16_LE_BOM) else 3 if data.startswith(UTF_8_BOM) else 0
+    return _BOM_OFFSETS.get(data[:3]) or _BOM_OFFSETS.get(data[:2], 0)
 
 
 def read_files(files: list[str]) -> bytes:
     print(f"Processing files: {', '.join(files)}")
-    output = b""
+    chunks: list[bytes] = []
     for file in files:
-        with open(file, "rb") as f:
+        # unbuffered: each file is read in one go, no BufferedReader copy
+        with open(file, "rb", buffering=0) as f:
             file_data = f.read()
-            output += file_data[_offset_by_bom(file_data) :]
-    return output
+            chunks.append(file_data[_offset_by_bom(file_data) :])
+    return b"".join(chunks)
 
 
 def save_output(file: str, output: bytes) -> None:
     print(f"Saving to file: {file} {len(output)} bytes")
-    with open(file, "wb") as f:
-        f.write(UTF_16_LE_BOM)
-        f.write(output)
+    with open(file, "wb", buffering=0) as f:
+        f.write(UTF_16_LE_BOM + output)
 
 
 def parse_args() -> tuple[str | None, list[str]]:
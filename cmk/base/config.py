@@ -2789,6 +2789,45 @@ class ConfigCache:
             (host_name, section_name), snmp_fetch_interval_impl()
         )
 
+    def snmp_fetch_intervals(
+        self, host_name: HostName, section_names: Iterable[SectionName]
+    ) -> Mapping[SectionName, int | None]:
+        """Return the fetch interval of many SNMP sections at once
+
+        Batched variant of `snmp_fetch_interval`: the interval ruleset is
+        matched once per host and all sections are evaluated against the
+        result, instead of re-running the ruleset matching per section.
+        """
+        intervals: dict[SectionName, int | None] = {}
+        missing: list[SectionName] = []
+        for section_name in section_names:
+            try:
+                intervals[section_name] = self.__snmp_fetch_interval[(host_name, section_name)]
+            except KeyError:
+                missing.append(section_name)
+
+        if not missing:
+            return intervals
+
+        host_values = self.ruleset_matcher.get_host_values(host_name, snmp_check_interval)
+
+        def snmp_fetch_interval_impl(section_name: SectionName) -> int | None:
+            section = agent_based_register.get_section_plugin(section_name)
+            if not isinstance(section, SNMPSectionPlugin):
+                return None  # no values at all for non snmp section
+
+            for match, minutes in host_values:
+                if match is None or match.split(".")[0] == str(section_name):
+                    return minutes * 60  # use first match
+
+            return None
+
+        for section_name in missing:
+            intervals[section_name] = self.__snmp_fetch_interval.setdefault(
+                (host_name, section_name), snmp_fetch_interval_impl(section_name)
+            )
+        return intervals
+
     def disabled_snmp_sections(self, host_name: HostName) -> frozenset[SectionName]:
         def disabled_snmp_sections_impl() -> frozenset[SectionName]:
             """Return a set of disabled snmp sections"""
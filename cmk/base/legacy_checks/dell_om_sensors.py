@@ -4,6 +4,8 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 
+from typing import Final
+
 from cmk.base.check_api import LegacyCheckDefinition
 from cmk.base.check_legacy_includes.temperature import check_temperature
 from cmk.base.config import check_info
@@ -13,60 +15,72 @@ from cmk.agent_based.v2.type_defs import StringTable
 from cmk.plugins.lib.dell import DETECT_OPENMANAGE
 
 
+_SENSOR_STATES: Final = {
+    1: "other",
+    2: "unknown",
+    10: "failed",
+}
+
+
 def dell_om_sensors_item(name):
     return name.replace("Temp", "").strip()
 
 
-def inventory_dell_om_sensors(info):
-    for line in info:
+def parse_dell_om_sensors(string_table: StringTable) -> dict[str, list[str]]:
+    # index each sensor row by its cleaned location name and - for items
+    # discovered by older versions - by the numeric sensor index
+    parsed: dict[str, list[str]] = {}
+    for line in string_table:
         if line[3]:
-            yield dell_om_sensors_item(line[3]), {}
+            parsed.setdefault(dell_om_sensors_item(line[3]), line)
+        parsed.setdefault(line[0], line)
+    return parsed
+
+
+def inventory_dell_om_sensors(parsed):
+    for item, line in parsed.items():
+        if item != line[0]:
+            yield item, {}
+
 
+def check_dell_om_sensors(item, params, parsed):
+    line = parsed.get(item)
+    if line is None:
+        return None
 
-def check_dell_om_sensors(item, params, info):
-    sensor_states = {
-        1: "other",
-        2: "unknown",
-        10: "failed",
-    }
-    for (
-        idx,
+    (
+        _idx,
         sensor_state,
         reading,
-        location_name,
+        _location_name,
         dev_crit,
         dev_warn,
         dev_warn_lower,
         dev_crit_lower,
-    ) in info:
-        if item == idx or dell_om_sensors_item(location_name) == item:
-            sensor_state = int(sensor_state)
-            if sensor_state in [1, 2, 10]:
-                return 2, "Sensor is: " + sensor_states[sensor_state]
-
-            temp = int(reading) / 10.0
-
-            dev_warn, dev_crit, dev_warn_lower, dev_crit_lower = (
-                float(v) / 10 if v else None
-                for v in [dev_warn, dev_crit, dev_warn_lower, dev_crit_lower]
-            )
-            if not dev_warn_lower:
-                dev_warn_lower = dev_crit_lower
-            if not dev_warn:
-                dev_warn = dev_crit
-
-            return check_temperature(
-                temp,
-                params,
-                "dell_om_sensors_%s" % item,
-                dev_levels=(dev_warn, dev_crit),
-                dev_levels_lower=(dev_warn_lower, dev_crit_lower),
-            )
-    return None
-
-
-def parse_dell_om_sensors(string_table: StringTable) -> StringTable:
-    return string_table
+    ) = line
+
+    sensor_state = int(sensor_state)
+    if sensor_state in _SENSOR_STATES:
+        return 2, "Sensor is: " + _SENSOR_STATES[sensor_state]
+
+    temp = int(reading) / 10.0
+
+    dev_warn = float(dev_warn) / 10 if dev_warn else None
+    dev_crit = float(dev_crit) / 10 if dev_crit else None
+    dev_warn_lower = float(dev_warn_lower) / 10 if dev_warn_lower else None
+    dev_crit_lower = float(dev_crit_lower) / 10 if dev_crit_lower else None
+    if not dev_warn_lower:
+        dev_warn_lower = dev_crit_lower
+    if not dev_warn:
+        dev_warn = dev_crit
+
+    return check_temperature(
+        temp,
+        params,
+        "dell_om_sensors_%s" % item,
+        dev_levels=(dev_warn, dev_crit),
+        dev_levels_lower=(dev_warn_lower, dev_crit_lower),
+    )
 
 
 check_info["dell_om_sensors"] = LegacyCheckDefinition(
@@ -19,13 +19,20 @@ from cmk.base.config import check_info
 from cmk.base.plugins.agent_based.agent_based_api.v1 import get_rate, get_value_store, render
 
 
+_TICK_KEYS = {
+    "Controller busy ticks": "busy",
+    "Controller idle ticks": "idle",
+}
+
+
 def parse_emcvnx_sp_util(string_table):
     parsed = {}
     for line in string_table:
-        if len(line) == 2 and "busy" in line[0]:
-            parsed.setdefault("busy", float(line[1]))
-        elif len(line) == 2 and "idle" in line[0]:
-            parsed.setdefault("idle", float(line[1]))
+        if len(line) != 2:
+            continue
+        key = _TICK_KEYS.get(line[0].strip())
+        if key is not None:
+            parsed.setdefault(key, float(line[1]))
     return parsed
 
 
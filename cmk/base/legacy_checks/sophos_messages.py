@@ -19,6 +19,7 @@
 
 
 import time
+from typing import Final
 
 from cmk.base.check_api import LegacyCheckDefinition
 from cmk.base.config import check_info
@@ -32,19 +33,21 @@ from cmk.base.plugins.agent_based.agent_based_api.v1 import (
 from cmk.agent_based.v2.type_defs import StringTable
 
 
+_COUNTER_RENAME: Final = {"InvalidRecipient": "Invalid Recipient"}
+
+
 def inventory_sophos_messages(info):
-    return [(line[0].replace("InvalidRecipient", "Invalid Recipient"), None) for line in info]
+    return [(_COUNTER_RENAME.get(line[0], line[0]), None) for line in info]
 
 
 def check_sophos_messages(item, params, info):
     for counter_type, inbound_str, outbound_str in info:
-        if counter_type.replace("InvalidRecipient", "Invalid Recipient") == item:
+        if _COUNTER_RENAME.get(counter_type, counter_type) == item:
             now = time.time()
-            inbound = get_rate(
-                get_value_store(), "inbound", now, int(inbound_str), raise_overflow=True
-            )
+            value_store = get_value_store()
+            inbound = get_rate(value_store, "inbound", now, int(inbound_str), raise_overflow=True)
             outbound = get_rate(
-                get_value_store(), "outbound", now, int(outbound_str), raise_overflow=True
+                value_store, "outbound", now, int(outbound_str), raise_overflow=True
             )
             infotext = (
                 "{:.1f} Inbounds and Outbounds/s, {:.1f} Inbounds/s, {:.1f} Outbounds/s".format(
@@ -6,7 +6,7 @@
 
 import json
 import time
-from typing import Any, Mapping, Sequence
+from typing import Any, Final, Mapping, Sequence
 
 from cmk.base.plugins.agent_based.agent_based_api.v1 import (
     check_levels,
@@ -27,10 +27,45 @@ from cmk.base.plugins.agent_based.agent_based_api.v1.type_defs import (
 
 Section = Mapping
 
+_MAP_HEALTH_STATES: Final[Mapping[str, tuple[State, str]]] = {
+    "HEALTH_OK": (State.OK, "OK"),
+    "HEALTH_WARN": (State.WARN, "warning"),
+    "HEALTH_CRIT": (State.CRIT, "critical"),
+    "HEALTH_ERR": (State.CRIT, "error"),
+}
+
+# Suggested by customer
+_MAP_PG_STATES: Final[Mapping[str, tuple[State, str]]] = {
+    "active": (State.OK, "active"),
+    "backfill": (State.OK, "backfill"),
+    "backfill_wait": (State.WARN, "backfill wait"),
+    "backfilling": (State.WARN, "backfilling"),
+    "backfill_toofull": (State.OK, "backfill too full"),
+    "clean": (State.OK, "clean"),
+    "creating": (State.OK, "creating"),
+    "degraded": (State.WARN, "degraded"),
+    "down": (State.CRIT, "down"),
+    "deep": (State.OK, "deep"),
+    "incomplete": (State.CRIT, "incomplete"),
+    "inconsistent": (State.CRIT, "inconsistent"),
+    "peered": (State.CRIT, "peered"),
+    "peering": (State.OK, "peering"),
+    "recovering": (State.OK, "recovering"),
+    "recovery_wait": (State.OK, "recovery wait"),
+    "remapped": (State.OK, "remapped"),
+    "repair": (State.OK, "repair"),
+    "replay": (State.WARN, "replay"),
+    "scrubbing": (State.OK, "scrubbing"),
+    "snaptrim": (State.OK, "snaptrim"),
+    "snaptrim_wait": (State.OK, "snaptrim wait"),
+    "stale": (State.CRIT, "stale"),
+    "undersized": (State.OK, "undersized"),
+    "wait_backfill": (State.OK, "wait backfill"),
+}
+
 
 def parse_ceph_status(string_table: StringTable) -> Section:
-    joined_lines = [" ".join(line) for line in string_table]
-    section = json.loads("".join(joined_lines))
+    section = json.loads(" ".join(word for line in string_table for word in line))
 
     # ceph health' JSON format has changed in luminous
     if "health" in section and "status" not in section["health"]:
@@ -44,7 +79,7 @@ def ceph_check_epoch(id_: str, epoch: float, params: Mapping[str, Any]) -> Check
     now = time.time()
     value_store = get_value_store()
     epoch_rate = get_rate(
-        get_value_store(),
+        value_store,
         f"{id_}.epoch.rate",
         now,
         epoch,
@@ -75,28 +110,22 @@ def discovery_ceph_status(section: Section) -> DiscoveryResult:
 
 
 def _extract_error_messages(section: Section) -> Sequence[str]:
-    error_messages = []
-    for err in section.get("health", {}).get("checks", {}).values():
-        err_msg = err.get("summary", {}).get("message")
-        if err_msg:
-            error_messages.append(err_msg)
-    return sorted(error_messages)
+    error_messages = [
+        err_msg
+        for err in section.get("health", {}).get("checks", {}).values()
+        if (err_msg := err.get("summary", {}).get("message"))
+    ]
+    error_messages.sort()
+    return error_messages
 
 
 # TODO genereller Status -> ceph health (Ausnahmen für "too many PGs per OSD" als Option ermöglichen)
 def check_ceph_status(params: Mapping[str, Any], section: Section) -> CheckResult:
-    map_health_states: dict[str, tuple[State, str]] = {
-        "HEALTH_OK": (State.OK, "OK"),
-        "HEALTH_WARN": (State.WARN, "warning"),
-        "HEALTH_CRIT": (State.CRIT, "critical"),
-        "HEALTH_ERR": (State.CRIT, "error"),
-    }
-
     overall_status = section.get("health", {}).get("status")
     if not overall_status:
         return
 
-    state, state_readable = map_health_states.get(
+    state, state_readable = _MAP_HEALTH_STATES.get(
         overall_status,
         (State.UNKNOWN, "unknown[%s]" % overall_status),
     )
@@ -205,50 +234,21 @@ def discovery_ceph_status_pgs(section: Section) -> DiscoveryResult:
 
 
 def check_ceph_status_pgs(section: Section) -> CheckResult:
-    # Suggested by customer
-    map_pg_states: dict[str, tuple[State, str]] = {
-        "active": (State.OK, "active"),
-        "backfill": (State.OK, "backfill"),
-        "backfill_wait": (State.WARN, "backfill wait"),
-        "backfilling": (State.WARN, "backfilling"),
-        "backfill_toofull": (State.OK, "backfill too full"),
-        "clean": (State.OK, "clean"),
-        "creating": (State.OK, "creating"),
-        "degraded": (State.WARN, "degraded"),
-        "down": (State.CRIT, "down"),
-        "deep": (State.OK, "deep"),
-        "incomplete": (State.CRIT, "incomplete"),
-        "inconsistent": (State.CRIT, "inconsistent"),
-        "peered": (State.CRIT, "peered"),
-        "peering": (State.OK, "peering"),
-        "recovering": (State.OK, "recovering"),
-        "recovery_wait": (State.OK, "recovery wait"),
-        "remapped": (State.OK, "remapped"),
-        "repair": (State.OK, "repair"),
-        "replay": (State.WARN, "replay"),
-        "scrubbing": (State.OK, "scrubbing"),
-        "snaptrim": (State.OK, "snaptrim"),
-        "snaptrim_wait": (State.OK, "snaptrim wait"),
-        "stale": (State.CRIT, "stale"),
-        "undersized": (State.OK, "undersized"),
-        "wait_backfill": (State.OK, "wait backfill"),
-    }
-
     data = section["pgmap"]
     num_pgs = data["num_pgs"]
     yield Result(state=State.OK, summary="PGs: %s" % num_pgs)
 
     for pgs_by_state in data["pgs_by_state"]:
+        worst_state = State.OK
         statetexts = []
-        states = []
         for status in pgs_by_state["state_name"].split("+"):
-            state, state_readable = map_pg_states.get(
+            state, state_readable = _MAP_PG_STATES.get(
                 status, (State.UNKNOWN, "UNKNOWN[%s]" % status)
             )
-            states.append(state)
+            worst_state = State.worst(worst_state, state)
             statetexts.append(state_readable)
         yield Result(
-            state=State.worst(*states),
+            state=worst_state,
             summary="Status '{}': {}".format("+".join(statetexts), pgs_by_state["count"]),
         )
 
@@ -10,6 +10,8 @@
 import logging
 from collections.abc import Iterable, Sequence
 from contextlib import suppress
+from functools import lru_cache
+from pathlib import Path
 from typing import assert_never, Final
 
 import cmk.utils.password_store
@@ -59,6 +61,13 @@ from ._sources import (
 __all__ = ["make_sources", "make_parser"]
 
 
+@lru_cache(maxsize=4096)
+def _persisted_section_dir(host_name: HostName, fetcher_type: FetcherType, ident: str) -> Path:
+    # make_parser runs once per source per host per cycle; the directory
+    # only depends on these three values, so avoid rebuilding the path.
+    return make_persisted_section_dir(host_name, fetcher_type=fetcher_type, ident=ident)
+
+
 def make_parser(
     config_cache: ConfigCache,
     source: SourceInfo,
@@ -73,17 +82,10 @@ def make_parser(
         return SNMPParser(
             hostname,
             SectionStore[SNMPRawDataElem](
-                make_persisted_section_dir(
-                    source.hostname,
-                    fetcher_type=source.fetcher_type,
-                    ident=source.ident,
-                ),
+                _persisted_section_dir(source.hostname, source.fetcher_type, source.ident),
                 logger=logger,
             ),
-            check_intervals={
-                section_name: config_cache.snmp_fetch_interval(hostname, section_name)
-                for section_name in checking_sections
-            },
+            check_intervals=config_cache.snmp_fetch_intervals(hostname, checking_sections),
             keep_outdated=keep_outdated,
             logger=logger,
         )
@@ -91,9 +93,7 @@ def make_parser(
     return config_cache.make_agent_parser(
         hostname,
         SectionStore[Sequence[AgentRawDataSectionElem]](
-            make_persisted_section_dir(
-                source.hostname, fetcher_type=source.fetcher_type, ident=source.ident
-            ),
+            _persisted_section_dir(source.hostname, source.fetcher_type, source.ident),
             logger=logger,
         ),
         keep_outdated=keep_outdated,
@@ -131,19 +131,21 @@ class _Builder:
         self.max_age_snmp: Final = max_age_snmp
         self.snmp_backend_override: Final = snmp_backend_override
 
+        # These predicates run ruleset matching for the host; resolve them
+        # once instead of in every branch that needs them.
+        self._is_tcp_host: Final = config_cache.is_tcp_host(host_name)
+        self._is_snmp_host: Final = config_cache.is_snmp_host(host_name)
+
         self._elems: dict[str, Source] = {}
         self._initialize_agent_based()
 
-        if self.config_cache.is_tcp_host(self.host_name) and not self._elems:
+        if self._is_tcp_host and not self._elems:
             # User wants a special agent, a CheckMK agent, or both.  But
             # we didn't configure anything.  Let's report that.
             self._add(MissingSourceSource(self.host_name, self.ipaddress, "API/agent"))
 
         if not (
-            (
-                self.config_cache.is_snmp_host(self.host_name)
-                and not self.config_cache.is_tcp_host(self.host_name)
-            )
+            (self._is_snmp_host and not self._is_tcp_host)
             or "no-piggyback" in self.config_cache.tag_list(self.host_name)
         ):
             self._add(PiggybackSource(self.config_cache, self.host_name, self.ipaddress))
@@ -154,30 +156,38 @@ class _Builder:
     @property
     def sources(self) -> Sequence[Source]:
         # Always execute piggyback at the end
-        return sorted(
-            self._elems.values(),
-            key=lambda args: (
-                args.source_info().fetcher_type is FetcherType.PIGGYBACK,
-                args.source_info().ident,
-            ),
-        )
+        regular: list[tuple[str, Source]] = []
+        piggyback: list[tuple[str, Source]] = []
+        for source in self._elems.values():
+            info = source.source_info()
+            (piggyback if info.fetcher_type is FetcherType.PIGGYBACK else regular).append(
+                (info.ident, source)
+            )
+        regular.sort(key=lambda elem: elem[0])
+        piggyback.sort(key=lambda elem: elem[0])
+        return [source for _ident, source in regular + piggyback]
 
     def _initialize_agent_based(self) -> None:
         def make_special_agents() -> Iterable[Source]:
-            for agentname, params in self.config_cache.special_agents(self.host_name):
-                host_attrs = self.config_cache.get_host_attributes(self.host_name)
-                macros = self.config_cache.get_host_macros_from_attributes(
-                    self.host_name, host_attrs
-                )
-                special_agent = SpecialAgent(
-                    load_special_agents()[1],
-                    config.special_agent_info,
-                    self.host_name,
-                    self.ipaddress,
-                    host_attrs,
-                    cmk.utils.password_store.load(),
-                    macros=macros,
-                )
+            special_agent_params = tuple(self.config_cache.special_agents(self.host_name))
+            if not special_agent_params:
+                return
+
+            # All of this is independent of the individual rules; resolving it
+            # per rule would re-read the password store and the host attributes
+            # for every configured special agent.
+            host_attrs = self.config_cache.get_host_attributes(self.host_name)
+            macros = self.config_cache.get_host_macros_from_attributes(self.host_name, host_attrs)
+            special_agent = SpecialAgent(
+                load_special_agents()[1],
+                config.special_agent_info,
+                self.host_name,
+                self.ipaddress,
+                host_attrs,
+                cmk.utils.password_store.load(),
+                macros=macros,
+            )
+            for agentname, params in special_agent_params:
                 for agent_data in special_agent.iter_special_agent_commands(agentname, params):
                     yield SpecialAgentSource(
                         self.config_cache,
@@ -208,7 +218,7 @@ class _Builder:
             for elem in special_agents:
                 self._add(elem)
 
-        elif self.config_cache.is_tcp_host(self.host_name):
+        elif self._is_tcp_host:
             if special_agents:
                 self._add(special_agents[0])
             else:
@@ -231,7 +241,7 @@ class _Builder:
             SNMPFetcher.plugin_store = make_plugin_store()
 
     def _initialize_snmp_based(self) -> None:
-        if not self.config_cache.is_snmp_host(self.host_name):
+        if not self._is_snmp_host:
             return
 
         self._initialize_snmp_plugin_store()
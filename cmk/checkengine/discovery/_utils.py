@@ -6,8 +6,9 @@
 from __future__ import annotations
 
 import enum
-from collections.abc import Hashable, Iterable, Sequence
+from collections.abc import Hashable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Final, Generic, Literal, Protocol, Self, TypeVar
 
 __all__ = ["DiscoveryMode", "QualifiedDiscovery", "DiscoverySettings"]
@@ -28,13 +29,7 @@ class DiscoverySettings:
 
     @classmethod
     def from_discovery_mode(cls, mode: DiscoveryMode) -> Self:
-        return cls(
-            update_host_labels=mode is not DiscoveryMode.REMOVE,
-            add_new_services=mode
-            in (DiscoveryMode.NEW, DiscoveryMode.FIXALL, DiscoveryMode.REFRESH),
-            remove_vanished_services=mode in (DiscoveryMode.REMOVE, DiscoveryMode.FIXALL),
-            update_changed_services=mode is DiscoveryMode.REFRESH,
-        )
+        return cls(*_MODE_SETTINGS[mode])
 
     @classmethod
     def from_vs(cls, mode: DiscoveryVsSettings | None) -> Self:
@@ -54,10 +49,11 @@ class DiscoverySettings:
                 update_changed_services=True,
             )
 
+        settings = mode[1]
         return cls(
-            update_host_labels=mode[1].get("update_host_labels", False),
-            add_new_services=mode[1].get("add_new_services", False),
-            remove_vanished_services=mode[1].get("remove_vanished_services", False),
+            update_host_labels=settings.get("update_host_labels", False),
+            add_new_services=settings.get("add_new_services", False),
+            remove_vanished_services=settings.get("remove_vanished_services", False),
             update_changed_services=False,
         )
 
@@ -81,6 +77,18 @@ class DiscoveryMode(enum.Enum):
         return cls[value.upper().replace("-", "_")]
 
 
+# (update_host_labels, add_new_services, remove_vanished_services, update_changed_services)
+# per discovery mode, in DiscoverySettings field order
+_MODE_SETTINGS: Final[Mapping[DiscoveryMode, tuple[bool, bool, bool, bool]]] = {
+    DiscoveryMode.NEW: (True, True, False, False),
+    DiscoveryMode.REMOVE: (False, False, True, False),
+    DiscoveryMode.FIXALL: (True, True, True, False),
+    DiscoveryMode.REFRESH: (True, True, False, True),
+    DiscoveryMode.ONLY_HOST_LABELS: (True, False, False, False),
+    DiscoveryMode.FALLBACK: (True, False, False, False),
+}
+
+
 class _Discoverable(Protocol):
     """
     Required interface for a qualified discovery.
@@ -115,10 +123,18 @@ class QualifiedDiscovery(Generic[_DiscoveredItem]):
         current_dict = {v.id(): v for v in current}
         preexisting_dict = {v.id(): v for v in preexisting}
 
-        self.vanished: Final = [v for k, v in preexisting_dict.items() if k not in current_dict]
-        self.old: Final = [v for k, v in preexisting_dict.items() if k in current_dict]
+        vanished: list[_DiscoveredItem] = []
+        old: list[_DiscoveredItem] = []
+        for k, v in preexisting_dict.items():
+            (old if k in current_dict else vanished).append(v)
+
+        self.vanished: Final = vanished
+        self.old: Final = old
         self.new: Final = [v for k, v in current_dict.items() if k not in preexisting_dict]
-        self.present: Final = self.old + self.new
+
+    @cached_property
+    def present(self) -> list[_DiscoveredItem]:
+        return self.old + self.new
 
     @classmethod
     def empty(cls) -> QualifiedDiscovery:
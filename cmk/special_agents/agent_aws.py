@@ -22,6 +22,7 @@ from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum, StrEnum
+from multiprocessing.pool import ThreadPool
 from time import sleep
 from typing import Any, assert_never, Literal, NamedTuple, NotRequired, TYPE_CHECKING, TypeVar
 
@@ -5668,11 +5669,19 @@ def get_ecs_cluster_arns(ecs_client: BaseClient) -> Iterable[str]:
         yield from page["clusterArns"]
 
 
-def get_ecs_clusters(ecs_client: BaseClient, cluster_ids: Sequence[str]) -> Iterable[Cluster]:
-    # the ECS.Client API allows fetching up to 100 clusters at once
-    for chunk in _chunks(cluster_ids, length=100):
+def get_ecs_clusters(ecs_client: BaseClient, cluster_ids: Iterable[str]) -> Iterable[Cluster]:
+    # the ECS.Client API allows fetching up to 100 clusters at once; fan the
+    # chunked calls out to a small thread pool so the HTTP round trips overlap
+    ids = iter(cluster_ids)
+    chunks = iter(lambda: list(itertools.islice(ids, 100)), [])
+
+    def describe_chunk(chunk: Sequence[str]) -> Sequence[Mapping[str, object]]:
         clusters = ecs_client.describe_clusters(clusters=chunk, include=["TAGS"])  # type: ignore[attr-defined]
-        yield from [Cluster(**cluster_data) for cluster_data in clusters["clusters"]]
+        return clusters["clusters"]
+
+    with ThreadPool(4) as pool:
+        for cluster_datas in pool.imap(describe_chunk, chunks):
+            yield from (Cluster(**cluster_data) for cluster_data in cluster_datas)
 
 
 class ECSLimits(AWSSectionLimits):
@@ -5697,8 +5706,10 @@ class ECSLimits(AWSSectionLimits):
         quota_list = list(self._iter_service_quotas("ecs"))
         quota_dicts = [q.model_dump() for q in quota_list]
 
-        cluster_ids = list(get_ecs_cluster_arns(self._client))
-        cluster_dicts = [c.model_dump() for c in get_ecs_clusters(self._client, cluster_ids)]
+        cluster_dicts = [
+            c.model_dump()
+            for c in get_ecs_clusters(self._client, get_ecs_cluster_arns(self._client))
+        ]
 
         return quota_dicts, cluster_dicts
 
@@ -5809,8 +5820,7 @@ class ECSSummary(AWSSection):
             else:
                 yield from clusters
         else:
-            cluster_ids = list(self._get_cluster_ids())
-            yield from get_ecs_clusters(self._client, cluster_ids)
+            yield from get_ecs_clusters(self._client, self._get_cluster_ids())
 
     def _filter_clusters_by_tags(
         self, clusters: Iterable[Cluster]
@@ -5861,16 +5871,17 @@ class ECS(AWSSectionCloudwatch):
             )
         return AWSColleagueContents([], 0.0)
 
+    _METRICS_UNITS: tuple[tuple[str, str], ...] = (
+        ("CPUUtilization", "Percent"),
+        ("CPUReservation", "Percent"),
+        ("MemoryUtilization", "Percent"),
+        ("MemoryReservation", "Percent"),
+    )
+
     def _get_metrics(self, colleague_contents: AWSColleagueContents) -> Metrics:
-        muv: list[tuple[str, str]] = [
-            ("CPUUtilization", "Percent"),
-            ("CPUReservation", "Percent"),
-            ("MemoryUtilization", "Percent"),
-            ("MemoryReservation", "Percent"),
-        ]
         metrics: Metrics = []
         for idx, cluster_name in enumerate(colleague_contents.content):
-            for metric_name, unit in muv:
+            for metric_name, unit in self._METRICS_UNITS:
                 metric: Metric = {
                     "Id": self._create_id_for_metric_data_query(idx, metric_name),
                     "Label": cluster_name,
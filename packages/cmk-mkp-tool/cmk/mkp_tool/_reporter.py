@@ -3,7 +3,7 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 import os
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import suppress
 from itertools import chain
 from pathlib import Path
@@ -25,16 +25,17 @@ def _all_local_files(path_config: PathConfig) -> Mapping[PackagePart | None, set
     The linked paths are the ones referenced in the docs,
     while the resolved ones are considered an implementation detail and should be hidden.
     """
-    local_files_including_symlinks = {
-        Path(root, f)
-        for root, _dir, files in os.walk(path_config.local_root, followlinks=True)
-        for f in files
-        if not (f.startswith(".") or f.endswith(("~", ".pyc")))
-    }
+    local_files_including_symlinks = set(_iter_files(path_config.local_root))
 
+    # Files sharing a directory share its resolution; resolving every file
+    # path individually would repeat the same realpath walk per sibling.
+    resolved_dirs: dict[Path, Path] = {}
     resolved_to_abstracted: dict[Path, Path] = {}
     for path in local_files_including_symlinks:
-        resolved = path.resolve()
+        parent = path.parent
+        if (resolved_parent := resolved_dirs.get(parent)) is None:
+            resolved_parent = resolved_dirs.setdefault(parent, parent.resolve())
+        resolved = path.resolve() if path.is_symlink() else resolved_parent / path.name
         if resolved not in resolved_to_abstracted or resolved_to_abstracted[resolved] == resolved:
             resolved_to_abstracted[resolved] = path
 
@@ -52,6 +53,31 @@ def _all_local_files(path_config: PathConfig) -> Mapping[PackagePart | None, set
     return categorized_files
 
 
+def _iter_files(root: Path) -> Iterator[Path]:
+    """Iteratively walk the tree, following symlinks.
+
+    Uses os.scandir directly (rather than os.walk) so that the file type
+    information cached in the directory entries is reused instead of
+    triggering an extra stat call per entry.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=True):
+                        stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                if not (entry.name.startswith(".") or entry.name.endswith(("~", ".pyc"))):
+                    yield Path(entry.path)
+
+
 def _relative_path(
     package_part: PackagePart, resolved_full_path: Path, path_config: PathConfig
 ) -> Path:
@@ -107,6 +133,7 @@ def files_inventory(installer: Installer, path_config: PathConfig) -> Sequence[F
         ),
         key=lambda item: ("",) if item[2] is None else (item[2].name, item[2].version.sort_key),
     )
+    part_paths = {part: path_config.get_path(part) for part in PackagePart}
     return [
         FileMetaInfo(
             file=str(file),
@@ -114,7 +141,7 @@ def files_inventory(installer: Installer, path_config: PathConfig) -> Sequence[F
             version=package_id.version if package_id else "",
             part_id=part.ident if part else "",
             part_title=ui_title(part, lambda s: s) if part else "",
-            mode=_get_mode((path_config.get_path(part) / file) if part else file),
+            mode=_get_mode((part_paths[part] / file) if part else file),
         )
         for part, file, package_id in files_and_packages
     ]
@@ -21,12 +21,13 @@ from tests.testlib.rest_api_client import (
 from tests.unit.cmk.gui.conftest import WebTestAppForCMK
 
 from cmk.utils import version
-from cmk.utils.user import UserId
 
 managedtest = pytest.mark.skipif(version.edition() is not version.Edition.CME, reason="see #7213")
 
 ESCAPED_GROUP_NAME_PATTERN = "^(?!\\\\.\\\\.$|\\\\.$)[-a-zA-Z0-9_\\\\.]*\\\\Z"
 
+GROUP_TYPES = ("host", "contact", "service")
+
 
 @pytest.fixture
 def host(clients: ClientRegistry) -> HostGroupClient:
@@ -44,14 +45,14 @@ def service(clients: ClientRegistry) -> ServiceGroupClient:
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "contact", "service"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_required_alias_field_create(group_type: str, request: FixtureRequest) -> None:
     client = request.getfixturevalue(group_type)
     client.create(name="RandleMcMurphy", alias=None, expect_ok=False).assert_status_code(400)
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "contact", "service"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_openapi_groups(
     base: str,
     monkeypatch: pytest.MonkeyPatch,
@@ -72,7 +73,6 @@ def test_openapi_groups(
 
     group = {"name": name, "alias": alias, "customer": "provider"}
 
-    base = "/NO_SITE/check_mk/api/1.0"
     resp = aut_user_auth_wsgi_app.call_method(
         "post",
         base + f"/domain-types/{group_type}_group_config/collections/all",
@@ -127,8 +127,9 @@ def test_openapi_groups(
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "service", "contact"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_openapi_bulk_groups(
+    base: str,
     monkeypatch: pytest.MonkeyPatch,
     group_type: str,
     aut_user_auth_wsgi_app: WebTestAppForCMK,
@@ -138,11 +139,11 @@ def test_openapi_bulk_groups(
         for _i in range(2)
     ]
 
-    base = "/NO_SITE/check_mk/api/1.0"
+    create_params = json.dumps({"entries": groups})
     resp = aut_user_auth_wsgi_app.call_method(
         "post",
         base + f"/domain-types/{group_type}_group_config/actions/bulk-create/invoke",
-        params=json.dumps({"entries": groups}),
+        params=create_params,
         headers={"Accept": "application/json"},
         status=200,
         content_type="application/json",
@@ -160,7 +161,7 @@ def test_openapi_bulk_groups(
     _resp = aut_user_auth_wsgi_app.call_method(
         "post",
         base + f"/domain-types/{group_type}_group_config/actions/bulk-create/invoke",
-        params=json.dumps({"entries": groups}),
+        params=create_params,
         headers={"Accept": "application/json"},
         status=400,
         content_type="application/json",
@@ -230,8 +231,9 @@ def test_openapi_bulk_groups(
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "contact", "service"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_openapi_groups_with_customer(
+    base: str,
     monkeypatch: pytest.MonkeyPatch,
     group_type: str,
     aut_user_auth_wsgi_app: WebTestAppForCMK,
@@ -241,7 +243,6 @@ def test_openapi_groups_with_customer(
 
     group = {"name": name, "alias": alias, "customer": "global"}
 
-    base = "/NO_SITE/check_mk/api/1.0"
     _resp = aut_user_auth_wsgi_app.call_method(
         "post",
         base + f"/domain-types/{group_type}_group_config/collections/all",
@@ -293,12 +294,11 @@ def test_openapi_groups_with_customer(
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "contact", "service"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_openapi_group_values_are_links(
-    group_type: str, wsgi_app: WebTestAppForCMK, with_automation_user: tuple[UserId, str], base: str
+    group_type: str, aut_user_auth_wsgi_app: WebTestAppForCMK, base: str
 ) -> None:
-    username, secret = with_automation_user
-    wsgi_app.set_authorization(("Bearer", username + " " + secret))
+    wsgi_app = aut_user_auth_wsgi_app
 
     collection_url = f"{base}/domain-types/{group_type}_group_config/collections/all"
     response = wsgi_app.call_method(
@@ -334,12 +334,15 @@ def test_openapi_group_values_are_links(
     assert response.json["value"][0]["links"][0]["domainType"] == "link"
 
 
+_ALPHABET = string.ascii_letters + string.digits
+
+
 def _random_string(size):
-    return "".join(random.choice(string.ascii_letters + string.digits) for _ in range(size))
+    return "".join(random.choices(_ALPHABET, k=size))
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "contact", "service"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_delete_non_existing_group_types(
     aut_user_auth_wsgi_app: WebTestAppForCMK,
     group_type: str,
@@ -354,7 +357,7 @@ def test_delete_non_existing_group_types(
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "contact", "service"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_bulk_delete_non_existing_group_types(
     aut_user_auth_wsgi_app: WebTestAppForCMK,
     group_type: str,
@@ -380,7 +383,7 @@ def test_bulk_delete_non_existing_group_types(
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "service", "contact"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_openapi_bulk_group_schema(
     aut_user_auth_wsgi_app: WebTestAppForCMK,
     group_type: str,
@@ -512,7 +515,7 @@ def test_service_group_id_with_newline(
 
 
 @managedtest
-@pytest.mark.parametrize("group_type", ["host", "service", "contact"])
+@pytest.mark.parametrize("group_type", GROUP_TYPES)
 def test_group_attributes_required(
     request: FixtureRequest,
     group_type: str,